@@ -4,8 +4,17 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 import numpy as np
 import random
+import ctypes
+import math
 from PIL import Image
 
+try:
+    from numba import njit
+except ImportError:
+    # Sem o Numba instalado, as funções decoradas rodam como Python puro
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # Constantes do jogo e da janela
 MAZE_SIZE = 14          # Tamanho do labirinto (número de células em cada dimensão)
 PLAYER_RADIUS = 0.2     # Raio do jogador para detecção de colisões
@@ -14,98 +23,166 @@ SCREEN_HEIGHT = 720     # Altura da janela do jogo
 MOUSE_SENSITIVITY = 0.12  # Sensibilidade do mouse para a rotação da câmera
 PLAYER_SPEED = 0.1      # Velocidade de movimento do jogador
 
+# Geometria de um cubo unitário usado para as paredes
+# Define os 8 vértices do cubo
+CUBE_VERTICES = [
+    (0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1),
+    (0, 1, 0), (1, 1, 0), (1, 1, 1), (0, 1, 1)
+]
+# Define as faces do cubo utilizando os índices dos vértices, junto com o deslocamento (dx, dz)
+# da célula vizinha que esconde a face. A face de baixo nunca é vista da altura do jogador e é omitida
+CUBE_FACES = [
+    ((4, 5, 6, 7), None),
+    ((0, 1, 5, 4), (0, -1)),
+    ((2, 3, 7, 6), (0, 1)),
+    ((0, 3, 7, 4), (-1, 0)),
+    ((1, 2, 6, 5), (1, 0))
+]
+# Coordenadas de textura para cada vértice da face
+CUBE_TEX_COORDS = [(0, 0), (1, 0), (1, 1), (0, 1)]
+# Cada vértice é intercalado como (x, y, z, u, v) em float32
+VERTEX_FLOATS = 5
+VERTEX_STRIDE = VERTEX_FLOATS * 4
+
+# Gera o labirinto usando o algoritmo de backtracking (busca em profundidade), compilado pelo Numba.
+# Usa apenas arrays de tamanho fixo e índices inteiros para que o laço inteiro rode em código nativo.
+# A grade é uint8 (1 byte por célula) de ponta a ponta
+@njit("uint8[:, :](int64, int64)", cache=True)
+def _gen_maze_nb(size, seed):
+    np.random.seed(seed)
+    # Inicializa uma matriz preenchida com 1's (paredes)
+    maze = np.empty((size, size), np.uint8)
+    maze[:] = 1
+    # Pilha explícita: cada célula entra no máximo uma vez, então size * size posições bastam
+    stack = np.empty((size * size, 2), np.int64)
+    candidates = np.empty((4, 2), np.int64)
+    limit = size - 1
+
+    # Define o ponto de início do labirinto
+    stack[0, 0] = 1
+    stack[0, 1] = 1
+    top = 1
+    maze[1, 1] = 0  # Marca o ponto inicial como caminho (0)
+
+    while top > 0:
+        x = stack[top - 1, 0]
+        y = stack[top - 1, 1]
+        # Vizinhos dentro dos limites que ainda são paredes (movimentos de 2 em 2 para criar corredores)
+        k = 0
+        if y + 2 < limit and maze[x, y + 2] == 1:
+            candidates[k, 0] = x
+            candidates[k, 1] = y + 2
+            k += 1
+        if y - 2 > 0 and maze[x, y - 2] == 1:
+            candidates[k, 0] = x
+            candidates[k, 1] = y - 2
+            k += 1
+        if x + 2 < limit and maze[x + 2, y] == 1:
+            candidates[k, 0] = x + 2
+            candidates[k, 1] = y
+            k += 1
+        if x - 2 > 0 and maze[x - 2, y] == 1:
+            candidates[k, 0] = x - 2
+            candidates[k, 1] = y
+            k += 1
+
+        if k > 0:
+            # Escolhe um vizinho aleatório para visitar
+            choice = np.random.randint(0, k)
+            nx = candidates[choice, 0]
+            ny = candidates[choice, 1]
+            # Remove a parede intermediária entre o nó atual e o escolhido
+            maze[(x + nx) // 2, (y + ny) // 2] = 0
+            # Marca o vizinho como caminho
+            maze[nx, ny] = 0
+            # Adiciona o vizinho na pilha para continuar a exploração
+            stack[top, 0] = nx
+            stack[top, 1] = ny
+            top += 1
+        else:
+            # Se não houver vizinhos disponíveis, retrocede (backtracking)
+            top -= 1
+
+    return maze
+
 # Classe que representa o labirinto
 class Maze:
     def __init__(self, size):
         self.size = size
         self.grid = self.generate_maze()  # Cria o labirinto utilizando algoritmo de busca em profundidade
+        self.grid.setflags(write=False)  # A grade não muda depois de gerada
         self.portal_pos = self.find_valid_portal_position()  # Determina uma posição válida para o portal
+        # Máscara booleana das paredes com uma borda extra de paredes, indexada com deslocamento de +1,
+        # para que as colisões não precisem checar os limites da grade
+        self.wall_mask = np.ones((size + 2, size + 2), dtype=np.bool_)
+        self.wall_mask[1:-1, 1:-1] = self.grid.astype(np.bool_)
+        self.build_wall_vbo()  # Envia a geometria das paredes para a GPU uma única vez
+        self.build_portal_vbo()  # Envia o portal para a GPU
 
     # Gera o labirinto usando o algoritmo de backtracking (busca em profundidade)
     def generate_maze(self):
-        # Inicializa uma matriz preenchida com 1's (paredes)
-        maze = np.ones((self.size, self.size), dtype=int)
-        # Define o ponto de início do labirinto
-        stack = [(1, 1)]
-        maze[1, 1] = 0  # Marca o ponto inicial como caminho (0)
-
-        while stack:
-            x, y = stack[-1]
-            # Lista de vizinhos a serem visitados (movimentos de 2 em 2 para criar corredores)
-            neighbors = [(x + dx, y + dy) for dx, dy in [(0, 2), (0, -2), (2, 0), (-2, 0)]]
-            # Filtra vizinhos dentro dos limites e que ainda são paredes
-            neighbors = [(nx, ny) for nx, ny in neighbors if 0 < nx < self.size - 1 and 0 < ny < self.size - 1 and maze[nx, ny] == 1]
-
-            if neighbors:
-                # Escolhe um vizinho aleatório para visitar
-                nx, ny = random.choice(neighbors)
-                # Remove a parede intermediária entre o nó atual e o escolhido
-                maze[(x + nx) // 2, (y + ny) // 2] = 0
-                # Marca o vizinho como caminho
-                maze[nx, ny] = 0
-                # Adiciona o vizinho na pilha para continuar a exploração
-                stack.append((nx, ny))
-            else:
-                # Se não houver vizinhos disponíveis, retrocede (backtracking)
-                stack.pop()
-
-        return maze
+        # A semente vem do módulo random para que random.seed continue controlando o labirinto gerado
+        return _gen_maze_nb(self.size, random.randrange(2 ** 31))
 
     # Encontra uma posição válida para posicionar o portal (onde não há parede)
     def find_valid_portal_position(self):
         """Encontra uma posição válida para o portal (onde não há parede)."""
-        # Percorre a grade em ordem decrescente para posicionar o portal em uma área mais distante do início
-        for x in range(self.size - 1, 0, -1):
-            for z in range(self.size - 1, 0, -1):
-                if self.grid[x][z] == 0:  # Se for caminho, retorna essa posição
-                    return (x, z)
-        return (1, 1)  # Fallback: se não encontrar, retorna a posição inicial
-
-    # Desenha o labirinto, aplicando a textura da parede para cada célula com valor 1
-    def draw(self, wall_texture):
-        glBindTexture(GL_TEXTURE_2D, wall_texture)
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.grid[x][y] == 1:
-                    self.draw_textured_cube(x, 0, y)
-
-    # Desenha um cubo texturizado representando uma parede
-    def draw_textured_cube(self, x, y, z):
-        size = 1  # Tamanho de cada célula
-        # Define os 8 vértices do cubo
-        vertices = [
-            (x, y, z), (x + size, y, z), (x + size, y, z + size), (x, y, z + size),
-            (x, y + size, z), (x + size, y + size, z), (x + size, y + size, z + size), (x, y + size, z + size)
-        ]
-        # Define as 6 faces do cubo utilizando os índices dos vértices
-        faces = [
-            (0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4),
-            (2, 3, 7, 6), (0, 3, 7, 4), (1, 2, 6, 5)
-        ]
-        # Coordenadas de textura para cada vértice da face
-        tex_coords = [(0, 0), (1, 0), (1, 1), (0, 1)]
-
-        glBegin(GL_QUADS)
-        for face in faces:
-            for i, vertex in enumerate(face):
-                glTexCoord2fv(tex_coords[i % 4])
-                glVertex3fv(vertices[vertex])
-        glEnd()
-
-    # Desenha o portal utilizando a textura fornecida
-    def draw_portal(self, portal_texture):
+        # Usa o último caminho em ordem de linha para posicionar o portal em uma área mais distante do início
+        zeros = np.argwhere(self.grid == 0)
+        # Fallback: se não encontrar, retorna a posição inicial
+        return tuple(int(i) for i in zeros[-1]) if len(zeros) else (1, 1)
+
+    # Monta uma única vez a geometria de todas as paredes em um VBO intercalado (posição + textura)
+    def build_wall_vbo(self):
+        walls = self.grid == 1
+        # Máscara com uma borda extra de células abertas, para que as faces externas continuem visíveis
+        padded = np.zeros((self.size + 2, self.size + 2), dtype=bool)
+        padded[1:-1, 1:-1] = walls
+
+        faces = []
+        for face, neighbor in CUBE_FACES:
+            # Emite a face apenas nas paredes cujo vizinho naquela direção não é parede
+            if neighbor is None:
+                visible = walls
+            else:
+                dx, dz = neighbor
+                visible = walls & ~padded[1 + dx:1 + dx + self.size, 1 + dz:1 + dz + self.size]
+
+            # Modelo da face na origem: 4 vértices x (x, y, z, u, v), replicado e deslocado para cada célula
+            quad = np.array([CUBE_VERTICES[vertex] + CUBE_TEX_COORDS[i] for i, vertex in enumerate(face)],
+                            dtype=np.float32)
+            cells = np.argwhere(visible)
+            vertices = np.empty((len(cells), len(quad), VERTEX_FLOATS), dtype=np.float32)
+            vertices[:] = quad
+            vertices[:, :, 0] += cells[:, 0, None]
+            vertices[:, :, 2] += cells[:, 1, None]
+            faces.append(vertices.reshape(-1, VERTEX_FLOATS))
+        vertices = np.concatenate(faces)
+
+        self.wall_vertex_count = len(vertices)
+        self.wall_vbo = create_vbo(vertices)
+
+    # Desenha o labirinto com uma única chamada usando o VBO das paredes (a textura é vinculada por quem chama)
+    def draw(self):
+        draw_vbo(self.wall_vbo, self.wall_vertex_count)
+
+    # Desenha o portal (a textura é vinculada por quem chama)
+    def draw_portal(self):
+        draw_vbo(self.portal_vbo, 4)
+
+    # Envia o quadrilátero do portal para um VBO, já que sua posição não muda depois de criada
+    def build_portal_vbo(self):
         x, z = self.portal_pos
-        glBindTexture(GL_TEXTURE_2D, portal_texture)
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0)
-        glVertex3f(x, 0, z)
-        glTexCoord2f(1, 0)
-        glVertex3f(x + 1, 0, z)
-        glTexCoord2f(1, 1)
-        glVertex3f(x + 1, 1, z)
-        glTexCoord2f(0, 1)
-        glVertex3f(x, 1, z)
-        glEnd()
+        self.portal_vbo = create_vbo(np.array([
+            x, 0, z, 0, 0,
+            x + 1, 0, z, 1, 0,
+            x + 1, 1, z, 1, 1,
+            x, 1, z, 0, 1
+        ], dtype=np.float32))
+
+    # Libera os VBOs do labirinto ao fim da partida, já que o contexto OpenGL é reaproveitado
+    def release(self):
+        glDeleteBuffers(2, [self.wall_vbo, self.portal_vbo])
 
 # Classe que representa a câmera (ou jogador) e lida com seu movimento
 class Camera:
@@ -113,21 +190,19 @@ class Camera:
         # Posição inicial da câmera
         self.x, self.y, self.z = 1.5, 0.5, 1.5
         self.angle_yaw = 0  # Ângulo de rotação no eixo horizontal
+        self._yaw_cache = (None, 0.0, 0.0)  # Último ângulo usado e seu cosseno e seno
         self.maze = maze  # Referência ao labirinto para verificação de colisões
+        self.wall_mask = maze.wall_mask  # Atalho para a máscara de paredes, evitando a busca de atributo a cada colisão
 
     # Verifica se o jogador pode se mover para uma nova posição, checando colisões com as paredes
     def can_move(self, new_x, new_z):
-        maze_x, maze_z = int(new_x), int(new_z)
-        # Verifica se a posição está dentro dos limites e se é um caminho (0)
-        if 0 <= maze_x < len(self.maze.grid) and 0 <= maze_z < len(self.maze.grid[0]) and self.maze.grid[maze_x][maze_z] == 0:
-            # Checa as bordas do jogador para evitar colisões com paredes próximas
-            for dx in [-PLAYER_RADIUS, PLAYER_RADIUS]:
-                for dz in [-PLAYER_RADIUS, PLAYER_RADIUS]:
-                    check_x, check_z = new_x + dx, new_z + dz
-                    if self.maze.grid[int(check_x)][int(check_z)] == 1:
-                        return False
-            return True
-        return False
+        r = PLAYER_RADIUS
+        g = self.wall_mask
+        # Índices das bordas do jogador na máscara (a borda de paredes extra dispensa checar os limites)
+        x0, x1 = int(new_x - r) + 1, int(new_x + r) + 1
+        z0, z1 = int(new_z - r) + 1, int(new_z + r) + 1
+        # Checa as quatro quinas do jogador; a célula do centro sempre coincide com uma delas
+        return not (g[x0, z0] or g[x0, z1] or g[x1, z0] or g[x1, z1])
 
     # Move a câmera de acordo com os deslocamentos dx e dz, verificando colisões
     def move(self, dx, dz):
@@ -141,18 +216,37 @@ class Camera:
     def rotate(self, angle):
         self.angle_yaw += angle
 
+    # Retorna o cosseno e o seno do ângulo de visão, recalculando apenas quando o ângulo muda
+    def _cs(self):
+        yaw, c, s = self._yaw_cache
+        if self.angle_yaw != yaw:
+            rad = math.radians(self.angle_yaw)
+            c, s = math.cos(rad), math.sin(rad)
+            self._yaw_cache = (self.angle_yaw, c, s)
+        return c, s
+
     # Aplica a transformação de visualização (define a posição e direção da câmera)
     def apply(self):
-        glLoadIdentity()
-        gluLookAt(self.x, self.y, self.z,
-                  self.x + np.cos(np.radians(self.angle_yaw)), self.y, self.z + np.sin(np.radians(self.angle_yaw)),
-                  0, 1, 0)
+        c, s = self._cs()
+        x, y, z = self.x, self.y, self.z
+        # Equivale a gluLookAt olhando para (x + c, y, z + s) com up = (0, 1, 0): como a câmera só gira
+        # no eixo vertical, a matriz é uma rotação com 4 termos em c e s seguida da translação por -posição.
+        # Os valores estão em ordem de coluna, como o OpenGL espera
+        glLoadMatrixf(np.array([
+            -s, 0, -c, 0,
+            0, 1, 0, 0,
+            c, 0, -s, 0,
+            s * x - c * z, -y, c * x + s * z, 1
+        ], dtype=np.float32))
 
     # Verifica se a câmera colidiu com o portal
     def check_portal_collision(self, portal_pos):
         portal_x, portal_z = portal_pos
-        distance = np.sqrt((self.x - portal_x) ** 2 + (self.z - portal_z) ** 2)
-        return distance < 0.5  # Considera colisão se estiver a uma distância menor que 0.5
+        dx, dz = self.x - portal_x, self.z - portal_z
+        # Descarta rapidamente posições fora da caixa ao redor do portal
+        if abs(dx) > 0.5 or abs(dz) > 0.5:
+            return False
+        return dx * dx + dz * dz < 0.25  # Considera colisão se estiver a uma distância menor que 0.5
 
 # Função para carregar uma textura a partir de um arquivo
 def load_texture(filename):
@@ -161,21 +255,26 @@ def load_texture(filename):
     # Corrige a inversão vertical da imagem
     img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
 
-    # Converte a imagem para um array NumPy
-    img_data = np.array(img, dtype=np.uint8)
+    # Converte a imagem para um array NumPy contíguo (ordem C), que o PyOpenGL envia sem copiar
+    img_data = np.ascontiguousarray(np.asarray(img, dtype=np.uint8))
 
     # Gera um ID para a textura e a configura
     texture_id = glGenTextures(1)
     glBindTexture(GL_TEXTURE_2D, texture_id)
 
     # Define parâmetros de filtragem e de repetição da textura
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
 
-    # Define a imagem da textura
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, img.width, img.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
+    # Define a imagem da textura e gera a cadeia de mipmaps para as paredes distantes
+    if bool(glGenerateMipmap):
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, img.width, img.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
+        glGenerateMipmap(GL_TEXTURE_2D)
+    else:
+        # Contextos antigos sem glGenerateMipmap: o GLU monta os mipmaps a partir da imagem
+        gluBuild2DMipmaps(GL_TEXTURE_2D, GL_RGBA, img.width, img.height, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
 
     return texture_id
 
@@ -188,26 +287,47 @@ def setup_opengl():
     gluPerspective(60, (SCREEN_WIDTH / SCREEN_HEIGHT), 0.1, 50.0)
     glMatrixMode(GL_MODELVIEW)
 
-# Desenha o chão do labirinto com a textura fornecida
-def draw_floor(floor_texture):
+# Envia um array de vértices intercalados (x, y, z, u, v) para um VBO estático na GPU
+def create_vbo(vertices):
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vbo
+
+# Desenha os quadriláteros de um VBO intercalado (x, y, z, u, v) com uma única chamada
+def draw_vbo(vbo, vertex_count):
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+    glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(12))
+    glDrawArrays(GL_QUADS, 0, vertex_count)
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+# Desenha o chão do labirinto (a textura é vinculada por quem chama)
+def draw_floor(floor_vbo):
+    draw_vbo(floor_vbo, 4)
+
+# Envia o quadrilátero do chão para um VBO para não reenviar os vértices a cada quadro
+def build_floor_vbo():
     size = MAZE_SIZE
-    glBindTexture(GL_TEXTURE_2D, floor_texture)
-    glBegin(GL_QUADS)
-    glTexCoord2f(0, 0)
-    glVertex3f(0, 0, 0)
-    glTexCoord2f(1, 0)
-    glVertex3f(size, 0, 0)
-    glTexCoord2f(1, 1)
-    glVertex3f(size, 0, size)
-    glTexCoord2f(0, 1)
-    glVertex3f(0, 0, size)
-    glEnd()
+    return create_vbo(np.array([
+        0, 0, 0, 0, 0,
+        size, 0, 0, 1, 0,
+        size, 0, size, 1, 1,
+        0, 0, size, 0, 1
+    ], dtype=np.float32))
 
 # Função que trata os eventos do Pygame (entrada do usuário)
 def handle_events(camera):
     for event in pygame.event.get():
         # Se o usuário fechar a janela ou pressionar ESC, encerra o jogo
-        if event.type == QUIT or pygame.key.get_pressed()[K_ESCAPE]:
+        if event.type == QUIT:
+            return False
+        if event.type == KEYDOWN and event.key == K_ESCAPE:
             return False
         # Se o mouse se mover, a câmera é rotacionada conforme o movimento horizontal
         if event.type == pygame.MOUSEMOTION:
@@ -215,18 +335,72 @@ def handle_events(camera):
             camera.rotate(x * MOUSE_SENSITIVITY)
     return True
 
+# Renderiza um texto em uma textura OpenGL para ser desenhado na posição (x, y) da tela
+def create_text_texture(font, text, pos):
+    surface = font.render(text, True, (255, 255, 255))
+    width, height = surface.get_size()
+    text_data = pygame.image.tostring(surface, "RGBA", False)
+
+    texture_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture_id)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    # Evita que a filtragem misture as bordas opostas do texto
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+    return texture_id, pos[0], pos[1], width, height
+
+# Desenha textos sobre um fundo preto usando uma projeção ortográfica 2D no mesmo contexto OpenGL do jogo
+def draw_text_screen(texts):
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    # Projeção em pixels com a origem no canto superior esquerdo, como no blit do Pygame
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadIdentity()
+    glOrtho(0, SCREEN_WIDTH, SCREEN_HEIGHT, 0, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    glDisable(GL_DEPTH_TEST)
+    # O texto é renderizado com transparência nas bordas das letras
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    for texture_id, x, y, width, height in texts:
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0)
+        glVertex2f(x, y)
+        glTexCoord2f(1, 0)
+        glVertex2f(x + width, y)
+        glTexCoord2f(1, 1)
+        glVertex2f(x + width, y + height)
+        glTexCoord2f(0, 1)
+        glVertex2f(x, y + height)
+        glEnd()
+
+    # Restaura o estado usado pela cena 3D
+    glDisable(GL_BLEND)
+    glEnable(GL_DEPTH_TEST)
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+
+# Libera as texturas criadas para os textos de uma tela
+def delete_text_textures(texts):
+    glDeleteTextures([text[0] for text in texts])
+
 # Exibe o menu inicial do jogo
 def show_menu():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     font = pygame.font.Font(None, 74)
-    title_text = font.render("Jogo do Labirinto", True, (255, 255, 255))
-    start_text = pygame.font.Font(None, 50).render("Pressione ESPAÇO para começar", True, (255, 255, 255))
+    texts = [
+        create_text_texture(font, "Jogo do Labirinto", (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 100)),
+        create_text_texture(pygame.font.Font(None, 50), "Pressione ESPAÇO para começar",
+                            (SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 + 50)),
+    ]
 
     while True:
-        screen.fill((0, 0, 0))
-        screen.blit(title_text, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 100))
-        screen.blit(start_text, (SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 + 50))
+        draw_text_screen(texts)
         pygame.display.flip()
 
         for event in pygame.event.get():
@@ -235,20 +409,21 @@ def show_menu():
                 exit()  # Fecha o jogo corretamente
             # Ao pressionar a barra de espaço, sai do menu e inicia o jogo
             if event.type == KEYDOWN and event.key == K_SPACE:
+                delete_text_textures(texts)
                 return
 
 # Exibe a tela de vitória quando o jogador encontra o portal
 def show_win_screen():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     font = pygame.font.Font(None, 74)
-    win_text = font.render("Você encontrou o portal! Parabéns!", True, (255, 255, 255))
-    restart_text = pygame.font.Font(None, 50).render("Pressione R para reiniciar ou ESC para sair", True, (255, 255, 255))
+    texts = [
+        create_text_texture(font, "Você encontrou o portal! Parabéns!",
+                            (SCREEN_WIDTH // 2 - 300, SCREEN_HEIGHT // 2 - 50)),
+        create_text_texture(pygame.font.Font(None, 50), "Pressione R para reiniciar ou ESC para sair",
+                            (SCREEN_WIDTH // 2 - 300, SCREEN_HEIGHT // 2 + 50)),
+    ]
 
     while True:
-        screen.fill((0, 0, 0))
-        screen.blit(win_text, (SCREEN_WIDTH // 2 - 300, SCREEN_HEIGHT // 2 - 50))
-        screen.blit(restart_text, (SCREEN_WIDTH // 2 - 300, SCREEN_HEIGHT // 2 + 50))
+        draw_text_screen(texts)
         pygame.display.flip()
 
         for event in pygame.event.get():
@@ -258,77 +433,102 @@ def show_win_screen():
             # Se o usuário pressionar 'R', o jogo será reiniciado
             if event.type == KEYDOWN:
                 if event.key == K_r:
+                    delete_text_textures(texts)
                     return True  # Indica que o jogo deve reiniciar
                 if event.key == K_ESCAPE:
+                    delete_text_textures(texts)
                     return False  # Indica que o jogo deve fechar
 
-# Função principal que inicializa e executa o loop do jogo
-def main():
+# Inicializa uma única vez o Pygame, a janela OpenGL e os recursos que sobrevivem entre as partidas
+def init_once():
     pygame.init()
 
-    show_menu()  # Exibe o menu inicial antes de começar o jogo
+    # Inicializa a janela com suporte a OpenGL e double buffering; menus e jogo usam o mesmo contexto.
+    # Pede sincronização vertical para que o flip acompanhe o monitor; alguns drivers recusam o pedido
+    try:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DOUBLEBUF | OPENGL, vsync=1)
+    except pygame.error:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DOUBLEBUF | OPENGL)
 
-    # Inicializa a janela com suporte a OpenGL e double buffering
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DOUBLEBUF | OPENGL)
-    pygame.mouse.set_visible(False)  # Esconde o cursor do mouse
-    pygame.event.set_grab(True)       # Captura o mouse para que ele não saia da janela
-    clock = pygame.time.Clock()
+    setup_opengl()  # Configura as propriedades do OpenGL
 
     # Inicializa o mixer para tocar sons
     pygame.mixer.init()
-    portal_sound = pygame.mixer.Sound("win.wav")  # Carrega o som de vitória
+    resources = {
+        "clock": pygame.time.Clock(),
+        "portal_sound": pygame.mixer.Sound("win.wav"),  # Carrega o som de vitória
+        # Carrega as texturas para o chão, paredes e portal
+        "floor_texture": load_texture("chao.jpg"),
+        "wall_texture": load_texture("parede.jpg"),
+        "portal_texture": load_texture("portal.jpg"),
+        "floor_vbo": build_floor_vbo(),  # Envia o chão para a GPU
+    }
 
-    setup_opengl()  # Configura as propriedades do OpenGL
-    maze = Maze(MAZE_SIZE)  # Cria o labirinto
-    camera = Camera(maze)   # Cria a câmera vinculada ao labirinto
+    show_menu()  # Exibe o menu inicial antes de começar o jogo
 
-    # Carrega as texturas para o chão, paredes e portal
-    floor_texture = load_texture("chao.jpg")
-    wall_texture = load_texture("parede.jpg")
-    portal_texture = load_texture("portal.jpg")
+    # O cursor só é escondido e capturado quando o jogo começa
+    pygame.mouse.set_visible(False)  # Esconde o cursor do mouse
+    pygame.event.set_grab(True)       # Captura o mouse; com a captura, event.rel já traz os deslocamentos
+    return resources
 
-    running = True
-    while running:
-        # Trata os eventos de entrada (teclado, mouse)
-        running = handle_events(camera)
+# Executa uma partida; retorna True se o jogador encontrou o portal e False se saiu do jogo
+def run_round(resources):
+    clock = resources["clock"]
+    floor_texture = resources["floor_texture"]
+    wall_texture = resources["wall_texture"]
+    portal_texture = resources["portal_texture"]
+    floor_vbo = resources["floor_vbo"]
 
+    maze = Maze(MAZE_SIZE)  # Cria o labirinto
+    camera = Camera(maze)   # Cria a câmera vinculada ao labirinto
+
+    while handle_events(camera):  # Trata os eventos de entrada (teclado, mouse)
         # Movimentação do jogador utilizando as teclas W, A, S, D
+        c, s = camera._cs()
         keys = pygame.key.get_pressed()
         if keys[K_w]:
-            camera.move(PLAYER_SPEED * np.cos(np.radians(camera.angle_yaw)),
-                        PLAYER_SPEED * np.sin(np.radians(camera.angle_yaw)))
+            camera.move(PLAYER_SPEED * c, PLAYER_SPEED * s)
         if keys[K_s]:
-            camera.move(-PLAYER_SPEED * np.cos(np.radians(camera.angle_yaw)),
-                        -PLAYER_SPEED * np.sin(np.radians(camera.angle_yaw)))
+            camera.move(-PLAYER_SPEED * c, -PLAYER_SPEED * s)
         if keys[K_a]:
-            camera.move(PLAYER_SPEED * np.sin(np.radians(camera.angle_yaw)),
-                        -PLAYER_SPEED * np.cos(np.radians(camera.angle_yaw)))
+            camera.move(PLAYER_SPEED * s, -PLAYER_SPEED * c)
         if keys[K_d]:
-            camera.move(-PLAYER_SPEED * np.sin(np.radians(camera.angle_yaw)),
-                        PLAYER_SPEED * np.cos(np.radians(camera.angle_yaw)))
+            camera.move(-PLAYER_SPEED * s, PLAYER_SPEED * c)
 
         # Limpa os buffers de cor e profundidade
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         camera.apply()  # Aplica a transformação de visualização da câmera
 
-        # Desenha o chão, o labirinto (paredes) e o portal
-        draw_floor(floor_texture)
-        maze.draw(wall_texture)
-        maze.draw_portal(portal_texture)
+        # Desenha o chão, o labirinto (paredes) e o portal, vinculando cada textura uma única vez por quadro
+        glBindTexture(GL_TEXTURE_2D, floor_texture)
+        draw_floor(floor_vbo)
+        glBindTexture(GL_TEXTURE_2D, wall_texture)
+        maze.draw()
+        glBindTexture(GL_TEXTURE_2D, portal_texture)
+        maze.draw_portal()
 
         # Verifica se houve colisão do jogador com o portal
         if camera.check_portal_collision(maze.portal_pos):
-            portal_sound.play()  # Toca o som de vitória
-            # Exibe a tela de vitória e reinicia ou finaliza o jogo conforme a escolha do jogador
-            if show_win_screen():
-                return main()  # Reinicia o jogo chamando a função main novamente
-            else:
-                running = False  # Encerra o loop do jogo
+            resources["portal_sound"].play()  # Toca o som de vitória
+            maze.release()
+            return True
 
         pygame.display.flip()  # Atualiza a tela
-        clock.tick(60)         # Limita a taxa de quadros para 60 FPS
-        # Reposiciona o mouse no centro da tela para evitar deslocamentos acumulados
-        pygame.mouse.set_pos((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        # Limita a taxa de quadros a 60 FPS mesmo com vsync: o movimento avança PLAYER_SPEED por quadro,
+        # então monitores de 120/144 Hz ou drivers que ignoram o vsync não mudam a velocidade do jogador
+        clock.tick(60)
+
+    maze.release()
+    return False
+
+# Função principal que inicializa e executa o loop do jogo
+def main():
+    resources = init_once()
+
+    # Joga partidas enquanto o jogador encontrar o portal e escolher reiniciar na tela de vitória
+    while run_round(resources):
+        if not show_win_screen():
+            break
 
     pygame.quit()  # Encerra o Pygame ao sair do loop
 